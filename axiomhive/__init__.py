@@ -13,25 +13,90 @@ __version__ = "1.0.0"
 __author__ = "Alexis Adams"
 __company__ = "AxiomHive"
 
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
+import hashlib
 import logging
 
+import numpy as np
+
+from .core._canonical import canonical_update
+from .core._fusion import DEFAULT_CONFIDENCE, fuse
+from .core._hashing import digest_matches, is_hex_digest
+
 logger = logging.getLogger(__name__)
 
+# Decision vocabulary of batched (structure-of-arrays) results; decisions are
+# stored as int8 indices into this tuple. process() accepts any label.
+DECISION_LABELS = ("REJECTED", "APPROVED")
+_DECISION_CODES = {label: code for code, label in enumerate(DECISION_LABELS)}
+
+
+def _decision_code(label: str) -> int:
+    """
+    int8 code of a decision label, with a clear error outside DECISION_LABELS.
+    """
+    try:
+        return _DECISION_CODES[label]
+    except KeyError:
+        raise ValueError(
+            f"process_batch() supports decisions {DECISION_LABELS}, got {label!r}; "
+            "use process() for other decision labels"
+        ) from None
+
+def _batch_rows(batch: Optional[Dict[str, Any]], count: int) -> List[Optional[Dict[str, Any]]]:
+    """
+    Per-input stage results rebuilt from a structure-of-arrays batch.
+    """
+    if batch is None:
+        return [None] * count
+    columns = {
+        key: column.tolist() if isinstance(column, np.ndarray) else column
+        for key, column in batch.items()
+    }
+    rows = [{key: column[index] for key, column in columns.items()} for index in range(count)]
+    for row in rows:
+        row["decision"] = DECISION_LABELS[row["decision"]]
+    return rows
+
 
-class ReasoningMode(Enum):
-    """Enum for hybrid reasoning modes."""
-    SYMBOLIC = "symbolic"  # Pure deterministic logic
-    PROBABILISTIC = "probabilistic"  # Pure neural inference
-    HYBRID = "hybrid"  # Fusion of both
-    VOTING = "voting"  # Ensemble voting
+# Stub engine results are input-independent; share one read-only instance
+# instead of building a fresh dict per call. The proxies keep a caller that
+# mutates a stage result from corrupting it for every model in the process.
+_SYMBOLIC_STUB_RESULT: Mapping[str, Any] = MappingProxyType({
+    "decision": "APPROVED",
+    "reasoning": "Constraint satisfaction verified via formal logic",
+    "verified": True
+})
+_PROBABILISTIC_STUB_RESULT: Mapping[str, Any] = MappingProxyType({
+    "decision": "APPROVED",
+    "confidence": 0.96,
+    "reasoning": "Pattern recognition confidence 96%"
+})
 
 
-@dataclass
+# External string names of ReasoningMode members, indexed by value
+_MODE_NAMES = ("symbolic", "probabilistic", "hybrid", "voting")
+
+
+class ReasoningMode(IntEnum):
+    """Enum for hybrid reasoning modes (int-valued for cheap compares and hashing)."""
+    SYMBOLIC = 0  # Pure deterministic logic
+    PROBABILISTIC = 1  # Pure neural inference
+    HYBRID = 2  # Fusion of both
+    VOTING = 3  # Ensemble voting
+
+    @property
+    def value_str(self) -> str:
+        """String name used in logs, audit trails, and attestation context."""
+        return _MODE_NAMES[self]
+
+
+@dataclass(slots=True, frozen=True)
 class HybridOutput:
-    """Deterministic output structure with full auditability."""
+    """Deterministic output structure with full auditability (immutable)."""
     output: Any
     reasoning_path: str
     confidence_score: float
@@ -42,6 +107,43 @@ class HybridOutput:
     compliance_verified: bool = False
 
 
+@dataclass(slots=True, frozen=True, eq=False)
+class BatchOutput:
+    """
+    Structure-of-arrays output of process_batch(); index i describes input i.
+    decision_codes index into DECISION_LABELS.
+    """
+    decision_codes: np.ndarray
+    confidence_scores: np.ndarray
+    reasoning_paths: List[str]
+    formal_verification: bool
+    attestation_hashes: Optional[List[str]] = None
+    symbolic_contribution: float = 0.0
+    probabilistic_contribution: float = 0.0
+    compliance_verified: bool = False
+
+    @property
+    def outputs(self) -> List[str]:
+        """Decision labels, one per input."""
+        return [DECISION_LABELS[code] for code in self.decision_codes.tolist()]
+
+    def __len__(self) -> int:
+        return len(self.decision_codes)
+
+    def __getitem__(self, index: int) -> HybridOutput:
+        """Materialize a single HybridOutput, e.g. for verify_output()."""
+        return HybridOutput(
+            output=DECISION_LABELS[self.decision_codes[index]],
+            reasoning_path=self.reasoning_paths[index],
+            confidence_score=float(self.confidence_scores[index]),
+            formal_verification=self.formal_verification,
+            attestation_hash=self.attestation_hashes[index] if self.attestation_hashes is not None else None,
+            symbolic_contribution=self.symbolic_contribution,
+            probabilistic_contribution=self.probabilistic_contribution,
+            compliance_verified=self.compliance_verified
+        )
+
+
 class AxiomHiveHybridModel:
     """
     Core AxiomHive Hybrid Model: Deterministic-Probabilistic Architecture
@@ -81,19 +183,81 @@ class AxiomHiveHybridModel:
         """
         self.symbolic_axioms_path = symbolic_axioms_path
         self.probabilistic_model_path = probabilistic_model_path
-        self.reasoning_mode = reasoning_mode
+        self._reasoning_mode = reasoning_mode
         self.attestation_enabled = attestation_enabled
-        self.compliance_mode = compliance_mode
+        self._compliance_mode = compliance_mode
         
         # Initialize symbolic and probabilistic engines (stubs for demo)
         self.symbolic_engine = None
         self.probabilistic_engine = None
         self.orchestrator = None
         
-        logger.info(f"AxiomHive Hybrid Model initialized (v{__version__})")
-        logger.info(f"Reasoning Mode: {reasoning_mode.value}")
-        logger.info(f"Attestation: {'Enabled' if attestation_enabled else 'Disabled'}")
-        logger.info(f"Compliance: {compliance_mode}")
+        # Instance-invariant attestation context, absorbed once and copied per hash
+        context = f"mode={reasoning_mode.value_str}|compliance={compliance_mode}|v={__version__}"
+        self._hash_prefix = hashlib.sha256(context.encode() + b"\x00")
+        
+        # Fusion strategy is fixed per instance; resolve it once. Single-pathway
+        # modes copy the stage result so the fused output is always the caller's own
+        self._orchestrate_fn = {
+            ReasoningMode.SYMBOLIC: lambda symbolic, probabilistic: dict(symbolic),
+            ReasoningMode.PROBABILISTIC: lambda symbolic, probabilistic: dict(probabilistic)
+        }.get(reasoning_mode, self._fuse_hybrid)
+        self._orchestrate_batch_fn = {
+            ReasoningMode.SYMBOLIC: lambda symbolic, probabilistic: symbolic,
+            ReasoningMode.PROBABILISTIC: lambda symbolic, probabilistic: probabilistic
+        }.get(reasoning_mode, self._fuse_hybrid_batch)
+        
+        # Scalar fusion overridden without its batched counterpart: process_batch()
+        # fuses per input through _orchestrate() so entries keep matching process()
+        cls = type(self)
+        self._fuse_batch_per_input = any(
+            getattr(cls, scalar) is not getattr(AxiomHiveHybridModel, scalar)
+            and getattr(cls, batched) is getattr(AxiomHiveHybridModel, batched)
+            for scalar, batched in (
+                ("_orchestrate", "_orchestrate_batch"),
+                ("_fuse_hybrid", "_fuse_hybrid_batch")
+            )
+        )
+        
+        # Partial evaluation: process() calls the pipeline for this mode directly,
+        # so per-call mode dispatch and unused stages disappear entirely
+        self._pipeline = {
+            ReasoningMode.SYMBOLIC: self._process_symbolic,
+            ReasoningMode.PROBABILISTIC: self._process_probabilistic
+        }.get(reasoning_mode, self._process_hybrid)
+        
+        # Audit record template; attestation_enabled is refreshed per call since
+        # it remains writable, the other fields are fixed at construction
+        self._audit_template = {
+            "version": __version__,
+            "reasoning_mode": reasoning_mode.value_str,
+            "attestation_enabled": attestation_enabled,
+            "compliance_mode": compliance_mode,
+            "author": __author__,
+            "company": __company__
+        }
+        
+        logger.info("AxiomHive Hybrid Model initialized (v%s)", __version__)
+        logger.info("Reasoning Mode: %s", reasoning_mode.value_str)
+        logger.info("Attestation: %s", "Enabled" if attestation_enabled else "Disabled")
+        logger.info("Compliance: %s", compliance_mode)
+
+    @property
+    def compliance_mode(self) -> str:
+        """
+        Compliance framework chosen at construction (read-only).
+        It is bound into every attestation hash, so it cannot change afterwards.
+        """
+        return self._compliance_mode
+
+    @property
+    def reasoning_mode(self) -> ReasoningMode:
+        """
+        Reasoning mode chosen at construction (read-only).
+        Stage selection, fusion, and the attestation context are all resolved
+        from it in __init__; create a new model to use a different mode.
+        """
+        return self._reasoning_mode
 
     def process(
         self,
@@ -118,20 +282,75 @@ class AxiomHiveHybridModel:
         
         Returns:
             HybridOutput with decision, reasoning, confidence, and attestation
-        """
-        logger.info(f"Processing input: {input_data}")
         
-        # Placeholder: implement full pipeline
+        Runs the pipeline selected for reasoning_mode in __init__, which only
+        invokes the stages that mode consumes.
+        """
+        logger.info("Processing input: %s", input_data)
+        return self._pipeline(input_data, require_explanation, verify_constraints)
+
+    def _process_symbolic(
+        self,
+        input_data: Union[str, Dict[str, Any]],
+        require_explanation: bool = True,
+        verify_constraints: bool = True
+    ) -> HybridOutput:
+        """
+        Pipeline for SYMBOLIC mode: probabilistic inference is never run.
+        """
+        symbolic_result = self._symbolic_reasoning(input_data, verify_constraints)
+        fused_output = self._orchestrate(symbolic_result, None)
+        return self._finalize(fused_output, require_explanation, verify_constraints)
+
+    def _process_probabilistic(
+        self,
+        input_data: Union[str, Dict[str, Any]],
+        require_explanation: bool = True,
+        verify_constraints: bool = True
+    ) -> HybridOutput:
+        """
+        Pipeline for PROBABILISTIC mode: symbolic reasoning is never run.
+        """
+        probabilistic_result = self._probabilistic_inference(input_data)
+        fused_output = self._orchestrate(None, probabilistic_result)
+        return self._finalize(fused_output, require_explanation, verify_constraints)
+
+    def _process_hybrid(
+        self,
+        input_data: Union[str, Dict[str, Any]],
+        require_explanation: bool = True,
+        verify_constraints: bool = True
+    ) -> HybridOutput:
+        """
+        Pipeline for HYBRID and VOTING modes.
+        """
         symbolic_result = self._symbolic_reasoning(input_data, verify_constraints)
         probabilistic_result = self._probabilistic_inference(input_data)
-        
         fused_output = self._orchestrate(symbolic_result, probabilistic_result)
-        attestation_hash = self._generate_attestation(fused_output) if self.attestation_enabled else None
+        return self._finalize(fused_output, require_explanation, verify_constraints)
+
+    def _finalize(
+        self,
+        fused_output: Dict[str, Any],
+        require_explanation: bool,
+        verify_constraints: bool
+    ) -> HybridOutput:
+        """
+        Attest a fused result and package it as a HybridOutput.
+        """
+        reasoning_path = fused_output.get("reasoning", "") if require_explanation else ""
+        confidence_score = fused_output.get("confidence", 0.0)
+        # Attest exactly the fields verify_output() recomputes
+        attestation_hash = self._generate_attestation({
+            "output": fused_output["decision"],
+            "reasoning_path": reasoning_path,
+            "confidence_score": confidence_score
+        }) if self.attestation_enabled else None
         
         return HybridOutput(
             output=fused_output["decision"],
-            reasoning_path=fused_output.get("reasoning", "") if require_explanation else "",
-            confidence_score=fused_output.get("confidence", 0.0),
+            reasoning_path=reasoning_path,
+            confidence_score=confidence_score,
             formal_verification=verify_constraints,
             attestation_hash=attestation_hash,
             symbolic_contribution=fused_output.get("symbolic_weight", 0.0),
@@ -139,65 +358,224 @@ class AxiomHiveHybridModel:
             compliance_verified=True
         )
 
-    def _symbolic_reasoning(self, input_data: Any, verify_constraints: bool) -> Dict[str, Any]:
+    def process_batch(
+        self,
+        inputs: Sequence[Union[str, Dict[str, Any]]],
+        require_explanation: bool = True,
+        verify_constraints: bool = True
+    ) -> BatchOutput:
+        """
+        Process many inputs through the hybrid pipeline.
+        
+        Each stage returns one column per field (structure-of-arrays) and
+        _orchestrate_batch() fuses the columns. The default stages and the
+        attestations still run per input. Entry i matches what
+        process(inputs[i]) would return, including its attestation hash.
+        Decisions must come from DECISION_LABELS; other labels raise ValueError.
+        
+        Args:
+            inputs: Sequence of input texts or structured data
+            require_explanation: Generate detailed reasoning paths
+            verify_constraints: Enforce formal constraint satisfaction
+        
+        Returns:
+            BatchOutput with per-input decisions, confidences, and attestations
+        """
+        logger.info("Processing batch of %d inputs", len(inputs))
+        
+        symbolic_batch = (
+            self._symbolic_reasoning_batch(inputs, verify_constraints)
+            if self.reasoning_mode != ReasoningMode.PROBABILISTIC else None
+        )
+        probabilistic_batch = (
+            self._probabilistic_inference_batch(inputs)
+            if self.reasoning_mode != ReasoningMode.SYMBOLIC else None
+        )
+        
+        fused = self._orchestrate_batch(symbolic_batch, probabilistic_batch)
+        decision_codes = fused["decision"]
+        confidences = fused.get("confidence")
+        if confidences is None:
+            confidences = np.zeros(len(inputs), dtype=np.float64)
+        reasoning_paths = fused["reasoning"] if require_explanation else [""] * len(inputs)
+        
+        attestation_hashes = None
+        if self.attestation_enabled:
+            attestation_hashes = [
+                self._generate_attestation({
+                    "output": DECISION_LABELS[code],
+                    "reasoning_path": reasoning_path,
+                    "confidence_score": confidence
+                })
+                for code, reasoning_path, confidence in zip(
+                    decision_codes.tolist(), reasoning_paths, confidences.tolist()
+                )
+            ]
+        
+        return BatchOutput(
+            decision_codes=decision_codes,
+            confidence_scores=confidences,
+            reasoning_paths=reasoning_paths,
+            formal_verification=verify_constraints,
+            attestation_hashes=attestation_hashes,
+            symbolic_contribution=fused.get("symbolic_weight", 0.0),
+            probabilistic_contribution=fused.get("probabilistic_weight", 0.0),
+            compliance_verified=True
+        )
+
+    def _symbolic_reasoning(self, input_data: Any, verify_constraints: bool) -> Mapping[str, Any]:
         """
         Deterministic symbolic reasoning via formal axioms.
         Returns formal verification result or constraint violation.
+        The returned mapping is shared between calls and read-only.
         """
         logger.debug("Executing symbolic reasoning engine")
-        return {
-            "decision": "APPROVED",
-            "reasoning": "Constraint satisfaction verified via formal logic",
-            "verified": True
-        }
+        return _SYMBOLIC_STUB_RESULT
 
-    def _probabilistic_inference(self, input_data: Any) -> Dict[str, Any]:
+    def _probabilistic_inference(self, input_data: Any) -> Mapping[str, Any]:
         """
         Probabilistic inference via neural networks.
         Returns pattern-based classification with confidence.
+        The returned mapping is shared between calls and read-only.
         """
         logger.debug("Executing probabilistic inference engine")
+        return _PROBABILISTIC_STUB_RESULT
+
+    def _symbolic_reasoning_batch(
+        self,
+        inputs: Sequence[Any],
+        verify_constraints: bool
+    ) -> Dict[str, Any]:
+        """
+        Batched symbolic reasoning in structure-of-arrays form.
+        Defaults to the per-input engine; vectorized engines override this.
+        """
+        results = [self._symbolic_reasoning(x, verify_constraints) for x in inputs]
         return {
-            "decision": "APPROVED",
-            "confidence": 0.96,
-            "reasoning": "Pattern recognition confidence 96%"
+            "decision": np.fromiter(
+                (_decision_code(r["decision"]) for r in results), dtype=np.int8, count=len(results)
+            ),
+            "reasoning": [r["reasoning"] for r in results]
+        }
+
+    def _probabilistic_inference_batch(self, inputs: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Batched probabilistic inference in structure-of-arrays form.
+        Defaults to the per-input engine; vectorized engines override this.
+        """
+        results = [self._probabilistic_inference(x) for x in inputs]
+        return {
+            "decision": np.fromiter(
+                (_decision_code(r["decision"]) for r in results), dtype=np.int8, count=len(results)
+            ),
+            "confidence": np.fromiter(
+                (r.get("confidence", DEFAULT_CONFIDENCE) for r in results), dtype=np.float64, count=len(results)
+            ),
+            "reasoning": [r["reasoning"] for r in results]
         }
 
     def _orchestrate(
         self,
-        symbolic: Dict[str, Any],
-        probabilistic: Dict[str, Any]
+        symbolic: Optional[Mapping[str, Any]],
+        probabilistic: Optional[Mapping[str, Any]]
     ) -> Dict[str, Any]:
         """
         Intelligent fusion of symbolic and probabilistic outputs.
         Implements voting, weighted consensus, or hierarchical decision logic.
+        The side a single-pathway mode does not use may be None. Returns a
+        new dict in every mode.
         """
-        logger.debug(f"Orchestrating hybrid decision via {self.reasoning_mode.value}")
-        
-        if self.reasoning_mode == ReasoningMode.SYMBOLIC:
-            return symbolic
-        elif self.reasoning_mode == ReasoningMode.PROBABILISTIC:
-            return probabilistic
-        else:  # HYBRID or VOTING
-            return {
-                "decision": symbolic["decision"],  # Symbolic takes precedence for safety
-                "confidence": probabilistic.get("confidence", 0.5),
-                "reasoning": f"Symbolic: {symbolic['reasoning']}; Probabilistic: {probabilistic['reasoning']}",
-                "symbolic_weight": 0.6,
-                "probabilistic_weight": 0.4
-            }
+        logger.debug("Orchestrating hybrid decision via %s", self.reasoning_mode.value_str)
+        return self._orchestrate_fn(symbolic, probabilistic)
+
+    def _orchestrate_batch(
+        self,
+        symbolic: Optional[Dict[str, Any]],
+        probabilistic: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Batched counterpart of _orchestrate() over structure-of-arrays results.
+        Subclasses that override _orchestrate() or _fuse_hybrid() without the
+        matching batched method are fused per input through _orchestrate().
+        """
+        if self._fuse_batch_per_input:
+            return self._orchestrate_per_input(symbolic, probabilistic)
+        return self._orchestrate_batch_fn(symbolic, probabilistic)
+
+    def _orchestrate_per_input(
+        self,
+        symbolic: Optional[Dict[str, Any]],
+        probabilistic: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Fuse a batch row by row with _orchestrate() and pack the result back
+        into columns. Rows only carry the columns the batch stages produce;
+        pathway weights are taken from the first row.
+        """
+        count = len((symbolic if symbolic is not None else probabilistic)["decision"])
+        fused_rows = [
+            self._orchestrate(s, p)
+            for s, p in zip(_batch_rows(symbolic, count), _batch_rows(probabilistic, count))
+        ]
+        first = fused_rows[0] if fused_rows else {}
+        return {
+            "decision": np.fromiter(
+                (_decision_code(f["decision"]) for f in fused_rows), dtype=np.int8, count=count
+            ),
+            "confidence": np.fromiter(
+                (f.get("confidence", 0.0) for f in fused_rows), dtype=np.float64, count=count
+            ),
+            "reasoning": [f.get("reasoning", "") for f in fused_rows],
+            "symbolic_weight": first.get("symbolic_weight", 0.0),
+            "probabilistic_weight": first.get("probabilistic_weight", 0.0)
+        }
+
+    def _fuse_hybrid(
+        self,
+        symbolic: Mapping[str, Any],
+        probabilistic: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Weighted fusion used by HYBRID and VOTING modes.
+        """
+        fused = fuse(symbolic, probabilistic)
+        fused["reasoning"] = f"Symbolic: {symbolic['reasoning']}; Probabilistic: {probabilistic['reasoning']}"
+        return fused
+
+    def _fuse_hybrid_batch(
+        self,
+        symbolic: Dict[str, Any],
+        probabilistic: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Batched counterpart of _fuse_hybrid() over structure-of-arrays results.
+        fuse() takes whole columns; the reasoning strings are built per input.
+        Confidences pass through unchanged, so they match the scalar path exactly.
+        """
+        fused = fuse(symbolic, probabilistic)
+        fused["reasoning"] = [
+            f"Symbolic: {s}; Probabilistic: {p}"
+            for s, p in zip(symbolic["reasoning"], probabilistic["reasoning"])
+        ]
+        return fused
+
+    def _attestation_digest(self, output: Dict[str, Any]) -> bytes:
+        """
+        Raw 32-byte SHA-256 digest of the canonical output bytes, bound to
+        this instance's reasoning mode, compliance mode, and model version.
+        """
+        h = self._hash_prefix.copy()
+        canonical_update(h, output)
+        return h.digest()
 
     def _generate_attestation(self, output: Dict[str, Any]) -> str:
         """
         Generate cryptographic attestation hash for verifiable output.
         Implements SHA-256 deterministic proof of correctness.
         """
-        import hashlib
-        import json
-        
-        output_str = json.dumps(output, sort_keys=True, default=str)
-        attestation = hashlib.sha256(output_str.encode()).hexdigest()
-        logger.debug(f"Attestation generated: {attestation[:16]}...")
+        attestation = self._attestation_digest(output).hex()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Attestation generated: %s...", attestation[:16])
         return attestation
 
     def verify_output(
@@ -208,38 +586,31 @@ class AxiomHiveHybridModel:
         """
         Verify output authenticity via cryptographic attestation.
         """
-        import hashlib
-        import json
-        
-        output_dict = {
-            "output": output.output,
-            "reasoning_path": output.reasoning_path,
-            "confidence_score": output.confidence_score
-        }
-        output_str = json.dumps(output_dict, sort_keys=True, default=str)
-        computed_hash = hashlib.sha256(output_str.encode()).hexdigest()
-        
-        is_valid = computed_hash == attestation_hash
-        logger.info(f"Output verification: {'PASSED' if is_valid else 'FAILED'}")
+        is_valid = False
+        if is_hex_digest(attestation_hash):
+            output_dict = {
+                "output": output.output,
+                "reasoning_path": output.reasoning_path,
+                "confidence_score": output.confidence_score
+            }
+            is_valid = digest_matches(self._attestation_digest(output_dict), attestation_hash)
+        logger.info("Output verification: %s", "PASSED" if is_valid else "FAILED")
         return is_valid
 
     def get_audit_trail(self) -> Dict[str, Any]:
         """
         Retrieve complete audit trail for compliance reporting.
         """
-        return {
-            "version": __version__,
-            "reasoning_mode": self.reasoning_mode.value,
-            "attestation_enabled": self.attestation_enabled,
-            "compliance_mode": self.compliance_mode,
-            "author": __author__,
-            "company": __company__
-        }
+        audit_trail = dict(self._audit_template)
+        audit_trail["attestation_enabled"] = self.attestation_enabled
+        return audit_trail
 
 
 # Export public API
 __all__ = [
     "AxiomHiveHybridModel",
+    "BatchOutput",
+    "DECISION_LABELS",
     "HybridOutput",
     "ReasoningMode",
     "__version__",
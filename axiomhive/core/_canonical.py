@@ -0,0 +1,263 @@
+"""
+AxiomHive Canonical Serialization
+
+JCS-style canonical byte encoding for attestation payloads:
+- Sorted keys, compact separators, ASCII-escaped strings
+- Fixed byte template for HybridOutput-derived dicts
+- Chunked streaming of large payloads straight into a hasher
+- json's C encoder for general documents, explicit type dispatch for
+  template fields and streaming; other types are encoded as str(value)
+
+Every path emits exactly the bytes of
+``json.dumps(d, sort_keys=True, separators=(",", ":"), default=str)``.
+Documents json rejects (keys it cannot order, or keys of unsupported
+types) are still encoded: their keys are stringified and sorted as strings.
+
+orjson/msgspec are intentionally not used: their output differs from this
+form (raw UTF-8 strings, ``1e16`` vs ``1e+16``, no integers past 64 bits),
+which would make hashes depend on what happens to be installed.
+
+Author: Alexis Adams, AxiomHive
+License: MIT
+"""
+
+import json
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+# Field names of the attested HybridOutput subset, pre-escaped and pre-sorted
+_HYBRID_OUTPUT_KEYS = frozenset(("confidence_score", "output", "reasoning_path"))
+_HYBRID_OUTPUT_TEMPLATE = b'{"confidence_score":%s,"output":%s,"reasoning_path":%s}'
+
+# Documents with more container members than this, counted over their top
+# _STREAM_PROBE_DEPTH levels, are streamed into the hasher; smaller ones are
+# encoded in one piece by json's C encoder, which is several times faster
+_STREAM_MIN_MEMBERS = 16 * 1024
+_STREAM_PROBE_DEPTH = 2
+
+# Target size of the chunks a streamed document is hashed in
+_CHUNK_SIZE = 64 * 1024
+
+_INFINITY = float("inf")
+
+# json.dumps() builds a new JSONEncoder per call when given options; build it once.
+# check_circular is off: its id() bookkeeping costs ~15% on large documents, and a
+# circular payload fails with RecursionError instead of ValueError either way
+_JSON_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), default=str, check_circular=False
+)
+
+
+def _float_str(value: float) -> str:
+    # Same spelling as json for non-finite values
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_str(key: Any) -> str:
+    t = type(key)
+    if t is str:
+        return key
+    if t is bool:
+        return "true" if key else "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return _float_str(key)
+    return str(key)
+
+
+def _encode_str(value: str) -> bytes:
+    return encode_basestring_ascii(value).encode()
+
+
+def _encode_bool(value: bool) -> bytes:
+    return b"true" if value else b"false"
+
+
+def _encode_int(value: int) -> bytes:
+    return int.__repr__(value).encode()
+
+
+def _encode_float(value: float) -> bytes:
+    return _float_str(value).encode()
+
+
+def _encode_none(value: None) -> bytes:
+    return b"null"
+
+
+def _encode_default(value: Any) -> bytes:
+    # json's default=str: encode the value's string form
+    return _encode_str(str(value))
+
+
+def _sorted_items(value: Dict[Any, Any]) -> List[Tuple[bytes, Any]]:
+    """
+    (encoded key, value) pairs in json's sort_keys order.
+    """
+    try:
+        items = sorted(value.items(), key=itemgetter(0))
+    except TypeError:
+        # json cannot order these keys (e.g. None next to ints); order by
+        # their string form instead
+        items = sorted(((_key_str(k), v) for k, v in value.items()), key=itemgetter(0))
+    return [(encode_basestring_ascii(_key_str(k)).encode(), v) for k, v in items]
+
+
+def _iter_dict(value: Dict[Any, Any]) -> Iterator[bytes]:
+    if not value:
+        yield b"{}"
+        return
+    sep = b"{"
+    for key, item in _sorted_items(value):
+        frag = _encode(item)
+        if type(frag) is bytes:
+            yield b"%s%s:%s" % (sep, key, frag)
+        else:
+            yield b"%s%s:" % (sep, key)
+            yield from frag
+        sep = b","
+    yield b"}"
+
+
+def _iter_list(value: List[Any]) -> Iterator[bytes]:
+    if not value:
+        yield b"[]"
+        return
+    sep = b"["
+    for item in value:
+        frag = _encode(item)
+        if type(frag) is bytes:
+            yield sep + frag
+        else:
+            yield sep
+            yield from frag
+        sep = b","
+    yield b"]"
+
+
+# Scalar encoders return bytes; only containers are generators
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    str: _encode_str,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    type(None): _encode_none,
+}
+_CONTAINER_TYPES = frozenset((dict, list, tuple))
+_ENCODERS: Dict[type, Callable[[Any], Union[bytes, Iterator[bytes]]]] = {
+    **_SCALAR_ENCODERS,
+    dict: _iter_dict,
+    list: _iter_list,
+    tuple: _iter_list,
+}
+
+
+def _encode(value: Any) -> Union[bytes, Iterator[bytes]]:
+    """
+    Canonical encoding of a value: bytes for scalars, a fragment iterator
+    for containers.
+    """
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        # Subclasses (IntEnum, OrderedDict, ...) encode as their JSON base type
+        for base in type(value).__mro__[1:]:
+            encoder = _ENCODERS.get(base)
+            if encoder is not None:
+                break
+        else:
+            encoder = _encode_default
+    return encoder(value)
+
+
+def _iter_value(value: Any) -> Iterator[bytes]:
+    frag = _encode(value)
+    if type(frag) is bytes:
+        yield frag
+    else:
+        yield from frag
+
+
+def _encode_document(value: Any) -> bytes:
+    """
+    Canonical bytes of an arbitrary value via json's C encoder, which
+    already emits this form. Keys json rejects (unorderable or of
+    unsupported types) go through the Python encoders instead.
+    """
+    try:
+        return _JSON_ENCODER.encode(value).encode()
+    except TypeError:
+        return b"".join(_iter_value(value))
+
+
+def _encode_value(value: Any) -> bytes:
+    encoder = _SCALAR_ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    return _encode_document(value)
+
+
+def _member_budget(value: Any, budget: int, depth: int) -> int:
+    """
+    Subtract the sizes of containers nested in value, down to depth levels,
+    from budget. Stops early and returns a negative number once exceeded.
+    """
+    for member in (value.values() if isinstance(value, dict) else value):
+        if type(member) in _CONTAINER_TYPES:
+            budget -= len(member)
+            if budget < 0:
+                return budget
+            if depth > 1:
+                budget = _member_budget(member, budget, depth - 1)
+                if budget < 0:
+                    return budget
+    return budget
+
+
+def canonicalize(d: Dict[str, Any]) -> bytes:
+    """
+    Serialize a dict to canonical JSON bytes for hashing.
+    """
+    if d.keys() == _HYBRID_OUTPUT_KEYS:
+        return _HYBRID_OUTPUT_TEMPLATE % (
+            _encode_value(d["confidence_score"]),
+            _encode_value(d["output"]),
+            _encode_value(d["reasoning_path"]),
+        )
+    return _encode_document(d)
+
+
+def canonical_update(h: Any, d: Dict[str, Any]) -> None:
+    """
+    Feed the canonical bytes of a dict into hasher h.
+    HybridOutput-shaped and small documents are encoded by canonicalize()
+    and hashed with one update(). Documents holding more than
+    _STREAM_MIN_MEMBERS container members in their top _STREAM_PROBE_DEPTH
+    levels are streamed in chunks of about _CHUNK_SIZE bytes, so the full
+    encoding is never held in memory; a single scalar larger than a chunk
+    is still encoded whole.
+    """
+    if (d.keys() == _HYBRID_OUTPUT_KEYS
+            or _member_budget(d, _STREAM_MIN_MEMBERS, _STREAM_PROBE_DEPTH) >= 0):
+        h.update(canonicalize(d))
+        return
+    buf = bytearray()
+    for frag in _iter_value(d):
+        buf += frag
+        if len(buf) >= _CHUNK_SIZE:
+            h.update(buf)  # hashed in place; no bytes copy per chunk
+            buf.clear()
+    if buf:
+        h.update(buf)
+
+
+__all__ = ["canonical_update", "canonicalize"]
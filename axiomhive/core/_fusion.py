@@ -0,0 +1,38 @@
+"""
+AxiomHive Fusion Rule
+
+Hybrid decision synthesis shared by the scalar and batched pipelines:
+- Symbolic decision takes precedence for safety
+- Confidence is reported from the probabilistic pathway
+- Pathway weights are reported alongside the fused result
+
+The rule only indexes its inputs, so it applies unchanged to per-input
+result dicts and to structure-of-arrays batches. The weights are part of
+every attested output, so they live here once rather than per call site.
+
+Author: Alexis Adams, AxiomHive
+License: MIT
+"""
+
+from typing import Any, Dict, Mapping
+
+SYMBOLIC_WEIGHT = 0.6
+PROBABILISTIC_WEIGHT = 0.4
+
+# Confidence assumed when the probabilistic pathway reports none
+DEFAULT_CONFIDENCE = 0.5
+
+
+def fuse(symbolic: Mapping[str, Any], probabilistic: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Fuse symbolic and probabilistic stage results (reasoning text excluded).
+    """
+    return {
+        "decision": symbolic["decision"],  # Symbolic takes precedence for safety
+        "confidence": probabilistic.get("confidence", DEFAULT_CONFIDENCE),
+        "symbolic_weight": SYMBOLIC_WEIGHT,
+        "probabilistic_weight": PROBABILISTIC_WEIGHT
+    }
+
+
+__all__ = ["DEFAULT_CONFIDENCE", "PROBABILISTIC_WEIGHT", "SYMBOLIC_WEIGHT", "fuse"]
@@ -0,0 +1,68 @@
+"""
+AxiomHive Hashing Backend
+
+SHA-256 helpers shared by the attestation paths:
+- Raw 32-byte digests internally, hex only at API boundaries
+- Constant-time comparison against hex attestation hashes
+- Import-time check that hashlib is backed by a modern OpenSSL build
+
+OpenSSL >= 1.1.1 dispatches SHA-256 to SHA-NI (x86) or the ARMv8 SHA2
+extensions when the CPU supports them; the builtin fallback is scalar.
+
+Author: Alexis Adams, AxiomHive
+License: MIT
+"""
+
+import hashlib
+import hmac
+import logging
+
+try:
+    import ssl
+except ImportError:  # Python built without OpenSSL
+    ssl = None
+
+logger = logging.getLogger(__name__)
+
+HEX_DIGEST_LENGTH = 2 * hashlib.sha256().digest_size
+
+
+def _check_backend() -> None:
+    """
+    Warn when SHA-256 cannot use OpenSSL's hardware-accelerated implementation.
+    """
+    openssl_backed = (
+        "sha256" in hashlib.algorithms_guaranteed
+        and getattr(hashlib.sha256, "__name__", "") == "openssl_sha256"
+    )
+    if ssl is None or not openssl_backed or ssl.OPENSSL_VERSION_INFO < (1, 1, 1):
+        logger.warning(
+            "hashlib SHA-256 is not backed by OpenSSL >= 1.1.1 (%s); "
+            "attestation hashing will not use SHA-NI/ARMv8 SHA2 acceleration",
+            ssl.OPENSSL_VERSION if ssl is not None else "no OpenSSL"
+        )
+
+
+_check_backend()
+
+
+def is_hex_digest(attestation_hash: str) -> bool:
+    """
+    Cheap shape check so malformed hashes are rejected before anything is hashed.
+    """
+    return isinstance(attestation_hash, str) and len(attestation_hash) == HEX_DIGEST_LENGTH
+
+
+def digest_matches(digest: bytes, attestation_hash: str) -> bool:
+    """
+    Constant-time comparison of a raw digest against a hex attestation hash.
+    Returns False for malformed hex instead of raising.
+    """
+    try:
+        expected = bytes.fromhex(attestation_hash)
+    except (TypeError, ValueError):
+        return False
+    return hmac.compare_digest(digest, expected)
+
+
+__all__ = ["HEX_DIGEST_LENGTH", "digest_matches", "is_hex_digest"]
@@ -12,9 +12,43 @@ License: MIT
 """
 
 import hashlib
-import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+import time
+import warnings
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime, timezone
+
+import numpy as np
+
+from ._canonical import canonical_update
+from ._hashing import digest_matches, is_hex_digest
+
+# Domain-separation tag absorbed ahead of every attestation payload
+_DOMAIN_TAG = b"AXIOMHIVE-ATTESTATION-V1\x00"
+
+_DIGEST_SIZE = 32
+
+# Supported attestation strategies; engines store the index once
+_STRATEGIES = ("sha256", "blockchain", "zk", "tee")
+_STRATEGY_IDS = {name: strategy_id for strategy_id, name in enumerate(_STRATEGIES)}
+
+_ISO_SECONDS_FMT = "%Y-%m-%dT%H:%M:%S"
+# (epoch second, formatted prefix) of the most recent timestamp
+_second_cache = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds, e.g.
+    2025-01-01T12:00:00.000123+00:00. The date/time prefix is formatted once
+    per second and reused; only the microseconds are formatted per call.
+    """
+    global _second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _second_cache
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, tz=timezone.utc).strftime(_ISO_SECONDS_FMT)
+        _second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
 
 
 class CryptographicAttestationEngine:
@@ -28,59 +62,161 @@ class CryptographicAttestationEngine:
     4. TEE attestation (hardware-backed)
     """
 
+    # Hasher state with the domain tag pre-absorbed; copied per attestation
+    _prefix = hashlib.sha256(_DOMAIN_TAG)
+
     def __init__(self, strategy: str = "sha256"):
-        self.strategy = strategy
-        self.attestation_log = []
+        try:
+            self._strategy_id = _STRATEGY_IDS[strategy]
+        except KeyError:
+            raise ValueError(
+                f"Unknown attestation strategy {strategy!r}; expected one of {_STRATEGIES}"
+            ) from None
+        # Columnar audit log: packed raw digests plus parallel timestamps;
+        # the strategy is fixed per engine so it is not stored per entry
+        self._hashes = bytearray()
+        self._timestamps: List[str] = []
+
+    @property
+    def strategy(self) -> str:
+        """
+        Attestation strategy chosen at construction (read-only).
+        """
+        return _STRATEGIES[self._strategy_id]
+
+    def __len__(self) -> int:
+        """
+        Number of attestations recorded in the audit log.
+        """
+        return len(self._timestamps)
 
     def generate_attestation(
         self,
         output: Dict[str, Any],
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> Tuple[str, str]:
         """
         Generate deterministic attestation hash for AI output.
+        The timestamp is part of the hashed payload and is returned alongside
+        the hash; pass it back to verify_attestation() to reproduce the hash.
+        Defaults to the current UTC time.
         """
+        if timestamp is None:
+            timestamp = _utc_timestamp()
         attestation_dict = {
             "output": output,
             "metadata": metadata or {},
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
-        attestation_str = json.dumps(attestation_dict, sort_keys=True, default=str)
-        attestation_hash = hashlib.sha256(attestation_str.encode()).hexdigest()
+        h = self._prefix.copy()
+        canonical_update(h, attestation_dict)
+        digest = h.digest()
+        
+        self._hashes += digest
+        self._timestamps.append(timestamp)
+        attestation_hash = digest.hex()
+        
+        return attestation_hash, timestamp
+
+    def generate_attestations_batch(
+        self,
+        outputs: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> Tuple[List[str], str]:
+        """
+        Generate attestation hashes for many outputs sharing one timestamp.
+        """
+        metadata = metadata or {}
+        if timestamp is None:
+            timestamp = _utc_timestamp()
+        hashes = []
         
-        self.attestation_log.append({
-            "hash": attestation_hash,
-            "timestamp": attestation_dict["timestamp"],
-            "strategy": self.strategy
-        })
+        for output in outputs:
+            h = self._prefix.copy()
+            canonical_update(h, {
+                "output": output,
+                "metadata": metadata,
+                "timestamp": timestamp
+            })
+            digest = h.digest()
+            self._hashes += digest
+            self._timestamps.append(timestamp)
+            hashes.append(digest.hex())
         
-        return attestation_hash
+        return hashes, timestamp
 
     def verify_attestation(
         self,
         output: Dict[str, Any],
         attestation_hash: str,
+        timestamp: str,
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Verify output authenticity via cryptographic attestation.
+        Requires the timestamp returned by generate_attestation().
         Returns True if attestation is valid, False otherwise.
         """
+        if not is_hex_digest(attestation_hash):
+            return False
         attestation_dict = {
             "output": output,
             "metadata": metadata or {},
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
-        attestation_str = json.dumps(attestation_dict, sort_keys=True, default=str)
-        computed_hash = hashlib.sha256(attestation_str.encode()).hexdigest()
+        h = self._prefix.copy()
+        canonical_update(h, attestation_dict)
+        computed_digest = h.digest()
         
-        return computed_hash == attestation_hash
+        return digest_matches(computed_digest, attestation_hash)
+
+    @property
+    def attestation_log(self) -> List[Dict[str, str]]:
+        """
+        Deprecated: use get_audit_trail(). Rebuilt from the columnar log on
+        each access, so appending to it does not record anything.
+        """
+        warnings.warn(
+            "CryptographicAttestationEngine.attestation_log is deprecated; "
+            "use get_audit_trail() or iter_audit_trail()",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self.get_audit_trail()
 
-    def get_audit_trail(self) -> list:
+    def get_audit_trail(self) -> List[Dict[str, str]]:
         """
         Retrieve complete audit trail for compliance.
+        Returns one {"hash", "timestamp", "strategy"} dict per attestation,
+        built from the columnar log on each call.
+        """
+        return list(self.iter_audit_trail())
+
+    def iter_audit_trail(self) -> Iterator[Dict[str, str]]:
+        """
+        Lazily yield the get_audit_trail() entries, one dict at a time, for
+        the attestations recorded when iteration starts.
+        """
+        strategy = self.strategy
+        hashes = self._hashes
+        timestamps = self._timestamps
+        for index in range(len(timestamps)):
+            offset = index * _DIGEST_SIZE
+            yield {
+                "hash": hashes[offset:offset + _DIGEST_SIZE].hex(),
+                "timestamp": timestamps[index],
+                "strategy": strategy
+            }
+
+    def get_audit_digests(self) -> np.ndarray:
+        """
+        Raw digests of the audit log as an (N, 32) uint8 array, in log order.
+        Built with a single copy of the packed digest buffer. uint8 rows are
+        used rather than 'S32' because NumPy bytes scalars drop trailing NULs.
         """
-        return self.attestation_log
+        return np.frombuffer(bytes(self._hashes), dtype=np.uint8).reshape(-1, _DIGEST_SIZE)
 
 
 __all__ = ["CryptographicAttestationEngine"]
@@ -0,0 +1,120 @@
+"""
+Tests for the cryptographic attestation engine.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from axiomhive.core._canonical import canonicalize
+from axiomhive.core.attestation import CryptographicAttestationEngine, _utc_timestamp
+
+OUTPUTS = [
+    {"output": "APPROVED", "reasoning_path": "r", "confidence_score": 0.96},
+    {"output": "REJECTED", "reasoning_path": "", "confidence_score": 0.0},
+    {"output": {"nested": ["café", 2 ** 80]}, "reasoning_path": "x", "confidence_score": 1.0},
+]
+TIMESTAMP = "2025-01-01T12:00:00.000123+00:00"
+
+
+def test_batch_matches_individual_attestations():
+    batch_engine = CryptographicAttestationEngine()
+    hashes, timestamp = batch_engine.generate_attestations_batch(OUTPUTS, {"m": 1}, TIMESTAMP)
+    assert timestamp == TIMESTAMP
+    single_engine = CryptographicAttestationEngine()
+    expected = [single_engine.generate_attestation(o, {"m": 1}, TIMESTAMP)[0] for o in OUTPUTS]
+    assert hashes == expected
+
+
+def test_attestations_are_domain_separated():
+    attestation_hash, _ = CryptographicAttestationEngine().generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    payload = canonicalize({"output": OUTPUTS[0], "metadata": {}, "timestamp": TIMESTAMP})
+    assert attestation_hash != hashlib.sha256(payload).hexdigest()
+    assert attestation_hash == hashlib.sha256(b"AXIOMHIVE-ATTESTATION-V1\x00" + payload).hexdigest()
+
+
+def test_attestation_round_trip():
+    engine = CryptographicAttestationEngine()
+    metadata = {"model": "test"}
+    attestation_hash, timestamp = engine.generate_attestation(OUTPUTS[0], metadata)
+    assert len(attestation_hash) == 64
+    assert engine.verify_attestation(OUTPUTS[0], attestation_hash, timestamp, metadata)
+
+
+def test_attestation_is_deterministic_for_fixed_timestamp():
+    first, _ = CryptographicAttestationEngine().generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    second, _ = CryptographicAttestationEngine().generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    assert first == second
+
+
+def test_verification_rejects_tampering():
+    engine = CryptographicAttestationEngine()
+    attestation_hash, timestamp = engine.generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    tampered = dict(OUTPUTS[0], confidence_score=0.97)
+    assert not engine.verify_attestation(tampered, attestation_hash, timestamp)
+    assert not engine.verify_attestation(OUTPUTS[0], attestation_hash, "2025-01-01T12:00:01.000000+00:00")
+    assert not engine.verify_attestation(OUTPUTS[0], attestation_hash, timestamp, {"extra": 1})
+
+
+def test_audit_trail_records_every_attestation():
+    engine = CryptographicAttestationEngine()
+    single, _ = engine.generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    batch, _ = engine.generate_attestations_batch(OUTPUTS[1:], timestamp=TIMESTAMP)
+    hashes = [single] + batch
+
+    assert len(engine) == 3
+    trail = engine.get_audit_trail()
+    assert isinstance(trail, list)
+    assert [entry["hash"] for entry in trail] == hashes
+    assert all(entry["timestamp"] == TIMESTAMP for entry in trail)
+    assert all(entry["strategy"] == "sha256" for entry in trail)
+    assert list(engine.iter_audit_trail()) == trail
+    json.dumps(trail)
+
+    digests = engine.get_audit_digests()
+    assert digests.shape == (3, 32)
+    assert digests.dtype == np.uint8
+    assert [row.tobytes().hex() for row in digests] == hashes
+
+
+def test_empty_audit_trail():
+    engine = CryptographicAttestationEngine()
+    assert engine.get_audit_trail() == []
+    assert engine.get_audit_digests().shape == (0, 32)
+
+
+def test_attestation_log_is_deprecated():
+    engine = CryptographicAttestationEngine()
+    engine.generate_attestation(OUTPUTS[0], timestamp=TIMESTAMP)
+    with pytest.warns(DeprecationWarning):
+        log = engine.attestation_log
+    assert log == engine.get_audit_trail()
+
+
+def test_strategy_is_read_only():
+    engine = CryptographicAttestationEngine("zk")
+    assert engine.strategy == "zk"
+    with pytest.raises(AttributeError):
+        engine.strategy = "tee"
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        CryptographicAttestationEngine("md5")
+
+
+@pytest.mark.parametrize("bad_hash", ["", "abc", "zz" * 32, None, 123])
+def test_verification_rejects_malformed_hashes(bad_hash):
+    engine = CryptographicAttestationEngine()
+    assert not engine.verify_attestation(OUTPUTS[0], bad_hash, TIMESTAMP)
+
+
+def test_utc_timestamp_is_iso_utc():
+    timestamp = _utc_timestamp()
+    parsed = datetime.fromisoformat(timestamp)
+    assert parsed.tzinfo == timezone.utc
+    assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 5
+    assert len(timestamp) == len("2025-01-01T12:00:00.000000+00:00")
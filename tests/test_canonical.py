@@ -0,0 +1,140 @@
+"""
+Tests for canonical attestation serialization.
+
+Attestation hashes depend on these bytes, so every fast path is checked
+byte-for-byte against json.dumps(sort_keys=True, separators=(",", ":"), default=str).
+"""
+
+import datetime
+import enum
+import hashlib
+import json
+from collections import OrderedDict
+
+import pytest
+
+from axiomhive.core import _canonical
+from axiomhive.core._canonical import _CHUNK_SIZE, canonical_update, canonicalize
+
+
+class Color(enum.IntEnum):
+    RED = 1
+    BLUE = 2
+
+
+class Opaque:
+    def __str__(self) -> str:
+        return "opaque<é>"
+
+
+class RecordingHasher:
+    """Stands in for a hashlib object and keeps every update() payload."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def update(self, data):
+        self.chunks.append(bytes(data))
+
+
+def reference(d):
+    return json.dumps(d, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def streamed(d):
+    h = RecordingHasher()
+    canonical_update(h, d)
+    return h.chunks
+
+
+@pytest.fixture
+def always_stream(monkeypatch):
+    monkeypatch.setattr(_canonical, "_STREAM_MIN_MEMBERS", -1)
+
+
+DOCUMENTS = [
+    {},
+    {"b": 1, "a": 2, "c": {"z": {}, "y": []}},
+    {"output": "APPROVED", "reasoning_path": "r", "confidence_score": 0.96},
+    {"output": {"nested": [1, 2]}, "reasoning_path": "", "confidence_score": 0},
+    {"text": "café 日本 \U0001f600", "ctrl": "tab\tnl\nquote\"back\\\x00\x7f"},
+    {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")},
+    {"floats": [0.1, 1e16, 1e-05, -0.0, 1.5e300, 123456789.123]},
+    {"big": 2 ** 100, "neg": -(2 ** 70), "zero": 0},
+    {"flags": [True, False, None]},
+    {"enum": Color.BLUE, "enum_list": [Color.RED]},
+    {"ordered": OrderedDict([("b", 1), ("a", 2)])},
+    {"tuple": (1, "two", (3.0,))},
+    {"date": datetime.date(2024, 1, 2), "obj": Opaque()},
+    {"ints": {10: "a", 2: "b"}, "numbers": {0.5: "x", 1: "y", True: "z"}},
+    {"list": [1, {"b": None}, "c"]},
+]
+
+# Documents json.dumps(sort_keys=True) rejects; still encoded deterministically
+REJECTED_BY_JSON = [
+    {1: "a", None: "b", "k": "c"},
+    {(1, 2): "tuple", "k": "str"},
+    {"nested": [{2: "int", "1": "str"}]},
+]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_canonicalize_matches_json_dumps(doc):
+    assert canonicalize(doc) == reference(doc)
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_streamed_bytes_match_canonicalize(doc, always_stream):
+    assert b"".join(streamed(doc)) == canonicalize(doc)
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_small_documents_are_hashed_in_one_update(doc):
+    assert streamed(doc) == [canonicalize(doc)]
+
+
+def test_large_payload_streams_in_chunks():
+    doc = {"items": ["x" * 10] * (2 * _canonical._STREAM_MIN_MEMBERS), "n": 1}
+    chunks = streamed(doc)
+    assert len(chunks) > 1
+    assert all(len(chunk) >= _CHUNK_SIZE for chunk in chunks[:-1])
+    assert b"".join(chunks) == reference(doc)
+
+
+def test_streamed_digest_matches_one_shot_digest():
+    doc = {"output": {"rows": [[i, str(i)] for i in range(40000)]}, "metadata": {}}
+    h = hashlib.sha256()
+    canonical_update(h, doc)
+    assert h.digest() == hashlib.sha256(reference(doc)).digest()
+
+
+def test_hybrid_output_shape_is_never_streamed():
+    doc = {"output": ["x"] * (2 * _canonical._STREAM_MIN_MEMBERS), "reasoning_path": "r", "confidence_score": 1.0}
+    assert streamed(doc) == [reference(doc)]
+
+
+def test_non_string_keys_are_stringified_like_json():
+    doc = {7: "int", None: "none", True: "bool", 2.5: "float"}
+    assert canonicalize(doc) == b'{"2.5":"float","7":"int","null":"none","true":"bool"}'
+
+
+def test_orderable_keys_sort_like_json():
+    assert canonicalize({10: "a", 2: "b"}) == b'{"2":"b","10":"a"}'
+
+
+def test_unorderable_keys_sort_as_strings():
+    # json.dumps(sort_keys=True) raises TypeError comparing None with int
+    assert canonicalize({1: "a", None: "b", "k": "c"}) == b'{"1":"a","k":"c","null":"b"}'
+    assert canonicalize({(1, 2): "t"}) == b'{"(1, 2)":"t"}'
+
+
+@pytest.mark.parametrize("doc", REJECTED_BY_JSON)
+def test_rejected_documents_stream_identical_bytes(doc, always_stream):
+    assert b"".join(streamed(doc)) == canonicalize(doc)
+
+
+def test_circular_documents_raise():
+    doc = {"a": []}
+    doc["a"].append(doc)
+    with pytest.raises(RecursionError):
+        canonicalize(doc)
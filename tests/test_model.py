@@ -0,0 +1,220 @@
+"""
+Tests for the hybrid model pipeline and output verification.
+"""
+
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+from axiomhive import (
+    DECISION_LABELS,
+    AxiomHiveHybridModel,
+    BatchOutput,
+    HybridOutput,
+    ReasoningMode,
+)
+
+
+@pytest.mark.parametrize("mode", list(ReasoningMode))
+def test_verify_output_round_trip(mode):
+    model = AxiomHiveHybridModel(reasoning_mode=mode)
+    result = model.process("input")
+    assert result.attestation_hash is not None
+    assert model.verify_output(result, result.attestation_hash)
+
+
+def test_verify_output_rejects_tampering():
+    model = AxiomHiveHybridModel()
+    result = model.process("input")
+    tampered = dataclasses.replace(result, confidence_score=0.5)
+    assert not model.verify_output(tampered, result.attestation_hash)
+    assert not model.verify_output(result, "00" * 32)
+
+
+def test_attestation_disabled():
+    model = AxiomHiveHybridModel(attestation_enabled=False)
+    assert model.process("input").attestation_hash is None
+
+
+def test_outputs_are_immutable():
+    result = AxiomHiveHybridModel().process("input")
+    assert isinstance(result, HybridOutput)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.output = "REJECTED"
+
+
+def test_hybrid_fusion_matches_baseline():
+    result = AxiomHiveHybridModel().process("input")
+    assert result.output == "APPROVED"
+    assert result.confidence_score == 0.96
+    assert result.symbolic_contribution == 0.6
+    assert result.probabilistic_contribution == 0.4
+    assert result.reasoning_path.startswith("Symbolic: ")
+
+
+INPUTS = ["approve loan", {"amount": 1000, "currency": "EUR"}, "café"]
+
+
+class CustomFusion(AxiomHiveHybridModel):
+    def _orchestrate(self, symbolic, probabilistic):
+        return {"decision": "REJECTED", "confidence": 0.1, "reasoning": "custom"}
+
+
+class CustomHybridFusion(AxiomHiveHybridModel):
+    def _fuse_hybrid(self, symbolic, probabilistic):
+        fused = super()._fuse_hybrid(symbolic, probabilistic)
+        fused["confidence"] = 0.25
+        return fused
+
+
+@pytest.mark.parametrize("require_explanation", [True, False])
+@pytest.mark.parametrize("mode", list(ReasoningMode))
+def test_process_batch_matches_process(mode, require_explanation):
+    model = AxiomHiveHybridModel(reasoning_mode=mode)
+    batch = model.process_batch(INPUTS, require_explanation=require_explanation)
+    assert isinstance(batch, BatchOutput)
+    assert len(batch) == len(INPUTS)
+    for i, x in enumerate(INPUTS):
+        assert batch[i] == model.process(x, require_explanation=require_explanation)
+        assert model.verify_output(batch[i], batch.attestation_hashes[i])
+    assert batch.outputs == [model.process(x).output for x in INPUTS]
+
+
+@pytest.mark.parametrize("model_cls", [CustomFusion, CustomHybridFusion])
+@pytest.mark.parametrize("mode", list(ReasoningMode))
+def test_process_batch_honors_scalar_fusion_overrides(model_cls, mode):
+    model = model_cls(reasoning_mode=mode)
+    batch = model.process_batch(INPUTS)
+    for i, x in enumerate(INPUTS):
+        assert batch[i] == model.process(x)
+
+
+def test_process_batch_uses_orchestrate_batch_override():
+    class BatchFusion(AxiomHiveHybridModel):
+        def _orchestrate_batch(self, symbolic, probabilistic):
+            fused = super()._orchestrate_batch(symbolic, probabilistic)
+            fused["decision"] = np.zeros_like(fused["decision"])
+            return fused
+
+    assert BatchFusion().process_batch(INPUTS).outputs == ["REJECTED"] * len(INPUTS)
+
+
+def test_process_batch_rejects_unknown_decisions():
+    class Escalating(AxiomHiveHybridModel):
+        def _symbolic_reasoning(self, input_data, verify_constraints):
+            return {"decision": "ESCALATE", "reasoning": "needs review", "verified": True}
+
+    model = Escalating()
+    assert model.process("input").output == "ESCALATE"
+    with pytest.raises(ValueError, match="ESCALATE"):
+        model.process_batch(INPUTS)
+
+
+def test_batch_decision_codes():
+    batch = AxiomHiveHybridModel().process_batch(INPUTS)
+    assert batch.decision_codes.dtype == np.int8
+    assert [DECISION_LABELS[c] for c in batch.decision_codes] == batch.outputs
+
+
+def test_batch_attestation_disabled():
+    batch = AxiomHiveHybridModel(attestation_enabled=False).process_batch(INPUTS)
+    assert batch.attestation_hashes is None
+    assert batch[0].attestation_hash is None
+
+
+def test_empty_batch():
+    batch = CustomFusion().process_batch([])
+    assert len(batch) == 0
+    assert batch.attestation_hashes == []
+
+
+@pytest.mark.parametrize("bad_hash", ["", "not a hash", "zz" * 32, None])
+def test_verify_output_rejects_malformed_hashes(bad_hash):
+    model = AxiomHiveHybridModel()
+    assert not model.verify_output(model.process("input"), bad_hash)
+
+
+def test_hash_is_bound_to_compliance_mode():
+    result = AxiomHiveHybridModel(compliance_mode="ISO42001").process("input")
+    other = AxiomHiveHybridModel(compliance_mode="SOC2")
+    assert not other.verify_output(result, result.attestation_hash)
+
+
+def test_compliance_mode_is_read_only():
+    model = AxiomHiveHybridModel()
+    with pytest.raises(AttributeError):
+        model.compliance_mode = "SOC2"
+
+
+def test_subclass_overrides_are_honored():
+    class Custom(AxiomHiveHybridModel):
+        def process(self, input_data, require_explanation=True, verify_constraints=True):
+            return "overridden"
+
+    assert Custom().process("input") == "overridden"
+    for mode in ReasoningMode:
+        result = CustomFusion(reasoning_mode=mode).process("input")
+        assert result.output == "REJECTED"
+        assert result.reasoning_path == "custom"
+
+
+def test_unused_stage_is_skipped():
+    class Tracking(AxiomHiveHybridModel):
+        calls = []
+
+        def _symbolic_reasoning(self, input_data, verify_constraints):
+            self.calls.append("symbolic")
+            return super()._symbolic_reasoning(input_data, verify_constraints)
+
+        def _probabilistic_inference(self, input_data):
+            self.calls.append("probabilistic")
+            return super()._probabilistic_inference(input_data)
+
+    Tracking(reasoning_mode=ReasoningMode.SYMBOLIC).process("input")
+    Tracking(reasoning_mode=ReasoningMode.SYMBOLIC).process_batch(INPUTS)
+    assert "probabilistic" not in Tracking.calls
+    Tracking.calls.clear()
+    Tracking(reasoning_mode=ReasoningMode.PROBABILISTIC).process("input")
+    Tracking(reasoning_mode=ReasoningMode.PROBABILISTIC).process_batch(INPUTS)
+    assert "symbolic" not in Tracking.calls
+
+
+def test_reasoning_mode_is_read_only():
+    model = AxiomHiveHybridModel(reasoning_mode=ReasoningMode.SYMBOLIC)
+    with pytest.raises(AttributeError):
+        model.reasoning_mode = ReasoningMode.HYBRID
+    assert model.reasoning_mode is ReasoningMode.SYMBOLIC
+
+
+def test_stub_results_cannot_be_corrupted():
+    class Adjusting(AxiomHiveHybridModel):
+        def _orchestrate(self, symbolic, probabilistic):
+            fused = super()._orchestrate(symbolic, probabilistic)
+            fused["confidence"] = 0.1
+            return fused
+
+    for mode in (ReasoningMode.SYMBOLIC, ReasoningMode.PROBABILISTIC):
+        assert Adjusting(reasoning_mode=mode).process("input").confidence_score == 0.1
+    assert AxiomHiveHybridModel(reasoning_mode=ReasoningMode.SYMBOLIC).process("input").confidence_score == 0.0
+    assert AxiomHiveHybridModel(reasoning_mode=ReasoningMode.PROBABILISTIC).process("input").confidence_score == 0.96
+
+    stage_result = AxiomHiveHybridModel()._symbolic_reasoning("input", True)
+    with pytest.raises(TypeError):
+        stage_result["decision"] = "REJECTED"
+
+
+def test_audit_trail_is_json_and_current():
+    model = AxiomHiveHybridModel(reasoning_mode=ReasoningMode.VOTING, compliance_mode="SOC2")
+    trail = model.get_audit_trail()
+    assert json.loads(json.dumps(trail)) == trail
+    assert trail["reasoning_mode"] == "voting"
+    assert trail["compliance_mode"] == "SOC2"
+    assert trail["attestation_enabled"] is True
+
+    trail["version"] = "tampered"
+    model.attestation_enabled = False
+    trail = model.get_audit_trail()
+    assert trail["attestation_enabled"] is False
+    assert trail["version"] != "tampered"